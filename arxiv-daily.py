@@ -12,12 +12,26 @@ usage: python main.py --config_path config.yaml
 
 import os
 import re
-import json
+import time
 import arxiv
+import orjson
 import yaml
 import logging
 import argparse
+import mmap
+import pickle
+import hashlib
+import string
 import datetime
+import functools
+import urllib.parse
+from operator import itemgetter
+
+# Use the C-accelerated libyaml loader when available
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:
+    from yaml import SafeLoader as Loader
 
 # Set arxiv library log level to WARNING to avoid verbose information
 logging.getLogger('arxiv').setLevel(logging.WARNING)
@@ -28,6 +42,66 @@ logging.basicConfig(format='[%(asctime)s %(levelname)s] %(message)s',
 
 arxiv_url = "http://arxiv.org/"
 
+# Directory for cached arXiv responses
+cache_dir = '.cache'
+
+# Version of the Markdown rendering, bump it whenever the rendered output changes so cached renderings are rebuilt
+render_version = 1
+
+# Maximum length of the URL-encoded union query before falling back to one query per keyword
+max_query_length = 2000
+
+# Pre-compiled patterns: span from the first to the last $ of math expressions for rendering,
+# markdown PDF link of legacy table rows
+_MATH_RE = re.compile(r"\$.*\$")
+_PDF_LINK_RE = re.compile(r'\[(.*?)\]\((.*?)\)')
+
+# Table row templates for web output: Date, Title, Last Author, Categories, PDF, Comments, [Abstract]
+_ROW_TEMPLATE = "|**{date}**|**{title}**|{last_author}|{categories}|[{paper_id}]({paper_url})|{comments}|\n"
+_ROW_ABSTRACT_TEMPLATE = "|**{date}**|**{title}**|{last_author}|{categories}|[{paper_id}]({paper_url})|{comments}|{abstract}|\n"
+
+# Shared arXiv client, reused by all keyword queries so that its HTTP session and request delay are shared
+client = arxiv.Client(page_size=100, delay_seconds=3, num_retries=5)
+
+def read_yaml(config_file: str) -> dict:
+    '''
+    Read YAML file, reusing the JSON cache of a previous parse while the file is unchanged
+    @param config_file: input config file path
+    @return: parsed YAML content
+    '''
+    config_path = os.path.abspath(config_file)
+    config_mtime = os.stat(config_file).st_mtime_ns
+    cache_file = os.path.join(cache_dir, 'config.json')
+
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = orjson.loads(f.read())
+            if cached['path'] == config_path and cached['mtime'] == config_mtime:
+                return cached['config']
+        except Exception as e:
+            logging.warning("Ignoring unreadable cache file %s: %s", cache_file, e)
+
+    with open(config_file, 'r') as f:
+        config = yaml.load(f, Loader=Loader)
+
+    # Only cache configurations that JSON gives back unchanged: dates would come back as strings,
+    # and non-string keys (numbers, YAML 1.1 booleans) cannot be written at all
+    try:
+        content = orjson.dumps({'path': config_path, 'mtime': config_mtime, 'config': config},
+                               option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError as e:
+        logging.info("Not caching configuration %s: %s", config_file, e)
+        return config
+    if orjson.loads(content)['config'] != config:
+        logging.info("Not caching configuration %s: it does not round-trip through JSON", config_file)
+        return config
+
+    os.makedirs(cache_dir, exist_ok=True)
+    write_file_atomic(cache_file, content)
+
+    return config
+
 def load_config(config_file: str) -> dict:
     '''
     Load configuration from YAML file
@@ -55,53 +129,55 @@ def load_config(config_file: str) -> dict:
             keywords[k] = parse_filters(v['filters'])
         return keywords
 
-    with open(config_file, 'r') as f:
-        config = yaml.load(f, Loader=yaml.FullLoader)
-        config['kv'] = pretty_filters(**config)
-        logging.info(f'Keywords: {list(config["keywords"].keys())}')
-        logging.info(f'Max results per keyword: {config["max_results"]}')
-        
-        # Load show_abstract configuration
-        config['show_abstract'] = config.get('show_abstract', False)
-        logging.info(f'Show abstract: {config["show_abstract"]}')
-
-        # Process date range configuration
-        date_range_enabled = False
-        if 'date_range' in config and config['date_range'].get('enabled', False):
-            date_range = config['date_range']
-            start_date_str = date_range.get('start_date')
-            end_date_str = date_range.get('end_date')
-
-            config['start_date'] = None
-            config['end_date'] = None
-
-            if start_date_str:
-                try:
-                    config['start_date'] = datetime.datetime.strptime(start_date_str, '%Y-%m-%d').date()
-                    date_range_enabled = True
-                except ValueError:
-                    logging.warning(f"Invalid start_date format: {start_date_str}, ignoring")
-
-            if end_date_str:
-                try:
-                    config['end_date'] = datetime.datetime.strptime(end_date_str, '%Y-%m-%d').date()
-                    date_range_enabled = True
-                except ValueError:
-                    logging.warning(f"Invalid end_date format: {end_date_str}, ignoring")
-
-            if date_range_enabled:
-                config['date_range_enabled'] = True
-                # Automatically disable cleanup when custom date range is enabled
-                if 'cleanup' in config:
-                    config['cleanup']['enabled'] = False
-                    logging.info("Auto-disabled cleanup due to custom date range")
-
-                date_range_str = f"{start_date_str} to {end_date_str}" if start_date_str and end_date_str else f"from {start_date_str}" if start_date_str else f"until {end_date_str}"
-                logging.info(f"Custom date range enabled: {date_range_str}")
-            else:
-                config['date_range_enabled'] = False
+    config = read_yaml(config_file)
+    config['kv'] = pretty_filters(**config)
+    logging.info("Keywords: %s", list(config["keywords"].keys()))
+    logging.info("Max results per keyword: %s", config["max_results"])
+    
+    # Load show_abstract configuration
+    config['show_abstract'] = config.get('show_abstract', False)
+    logging.info("Show abstract: %s", config["show_abstract"])
+
+    # Load arXiv response cache configuration
+    config['cache_ttl_seconds'] = config.get('cache_ttl_seconds', 0)
+
+    # Process date range configuration
+    date_range_enabled = False
+    if 'date_range' in config and config['date_range'].get('enabled', False):
+        date_range = config['date_range']
+        start_date_str = date_range.get('start_date')
+        end_date_str = date_range.get('end_date')
+
+        config['start_date'] = None
+        config['end_date'] = None
+
+        if start_date_str:
+            try:
+                config['start_date'] = datetime.datetime.strptime(start_date_str, '%Y-%m-%d').date()
+                date_range_enabled = True
+            except ValueError:
+                logging.warning("Invalid start_date format: %s, ignoring", start_date_str)
+
+        if end_date_str:
+            try:
+                config['end_date'] = datetime.datetime.strptime(end_date_str, '%Y-%m-%d').date()
+                date_range_enabled = True
+            except ValueError:
+                logging.warning("Invalid end_date format: %s, ignoring", end_date_str)
+
+        if date_range_enabled:
+            config['date_range_enabled'] = True
+            # Automatically disable cleanup when custom date range is enabled
+            if 'cleanup' in config:
+                config['cleanup']['enabled'] = False
+                logging.info("Auto-disabled cleanup due to custom date range")
+
+            date_range_str = f"{start_date_str} to {end_date_str}" if start_date_str and end_date_str else f"from {start_date_str}" if start_date_str else f"until {end_date_str}"
+            logging.info("Custom date range enabled: %s", date_range_str)
         else:
             config['date_range_enabled'] = False
+    else:
+        config['date_range_enabled'] = False
 
     return config
 
@@ -113,7 +189,7 @@ def get_authors(authors, last_author=False):
     @return: author string
     """
     if not last_author:
-        output = ", ".join(str(author) for author in authors)
+        output = ", ".join(map(str, authors))
     else:
         # Return only the last author
         output = authors[-1] if authors else ""
@@ -125,14 +201,118 @@ def sort_papers(papers):
     @param papers: dictionary of papers
     @return: sorted dictionary of papers
     """
-    output = dict()
-    keys = list(papers.keys())
-    keys.sort(reverse=True)
-    for key in keys:
-        output[key] = papers[key]
-    return output
+    return dict(sorted(papers.items(), key=itemgetter(0), reverse=True))
 
-def get_daily_papers(topic, query="slam", max_results=2, start_date=None, end_date=None, show_abstract=False):
+def build_query(query, start_date=None, end_date=None):
+    """
+    Build arXiv query string with date range
+    @param query: search query string
+    @param start_date: start date for filtering (datetime.date)
+    @param end_date: end date for filtering (datetime.date)
+    @return: full query string
+    """
+    full_query = query
+    if start_date and end_date:
+        # Convert dates to arXiv API required format
+        start_str = start_date.strftime("%Y%m%d")
+        end_str = end_date.strftime("%Y%m%d")
+        full_query = f"({query}) AND submittedDate:[{start_str} TO {end_str}]"
+    elif start_date:
+        start_str = start_date.strftime("%Y%m%d")
+        full_query = f"({query}) AND submittedDate:[{start_str} TO 20301231]"
+    elif end_date:
+        end_str = end_date.strftime("%Y%m%d")
+        full_query = f"({query}) AND submittedDate:[19910101 TO {end_str}]"
+    return full_query
+
+def fetch_results(full_query, max_results, end_date=None, cache_ttl=0):
+    """
+    Fetch arXiv search results, reusing cached responses on disk when available
+    @param full_query: full query string including date range
+    @param max_results: maximum number of results to fetch
+    @param end_date: end date for filtering (datetime.date), windows ending before today never change
+    @param cache_ttl: maximum age in seconds of a reusable cached response
+    @return: list of result dictionaries
+    """
+    key = hashlib.sha1(f"{full_query}|{max_results}".encode()).hexdigest()
+    cache_file = os.path.join(cache_dir, 'arxiv', f"{key}.pkl")
+
+    # Historical date windows are immutable, so their cached responses never expire
+    immutable = end_date is not None and end_date < datetime.date.today()
+    if os.path.exists(cache_file) and (immutable or time.time() - os.path.getmtime(cache_file) < cache_ttl):
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logging.warning("Ignoring unreadable cache file %s: %s", cache_file, e)
+
+    search = arxiv.Search(
+        query=full_query,
+        max_results=max_results,
+        sort_by=arxiv.SortCriterion.SubmittedDate
+    )
+    # Use the shared client to reuse the persistent HTTP session
+    results = [{'id': result.get_short_id(),
+                'title': result.title,
+                'authors': [str(author) for author in result.authors],
+                'published': result.published.date(),
+                'categories': result.categories,
+                'comment': result.comment,
+                'summary': result.summary}
+               for result in client.results(search)]
+
+    if immutable or cache_ttl > 0:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        write_file_atomic(cache_file, pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL))
+
+    return results
+
+def format_paper(result, show_abstract=False):
+    """
+    Format an arXiv result as a paper record
+    @param result: arXiv result dictionary
+    @param show_abstract: whether to include paper abstracts
+    @return: tuple of (paper_key, paper record)
+    """
+    paper_id = result['id']
+    paper_title = result['title']
+    paper_authors = get_authors(result['authors'])
+    paper_last_author = get_authors(result['authors'], last_author=True)
+    paper_date = result['published']  # Use publication date
+    categories = result['categories']
+    comments = result['comment']
+    abstract = result['summary'] if show_abstract else ""
+
+    # Extract paper key: eg: 2108.09112v1 -> 2108.09112
+    ver_pos = paper_id.find('v')
+    if ver_pos == -1:
+        paper_key = paper_id
+    else:
+        paper_key = paper_id[0:ver_pos]
+    paper_url = arxiv_url + 'abs/' + paper_key
+
+    # Process category information - join all categories with semicolon
+    categories_str = "; ".join(categories) if categories else ""
+
+    # Process comments - show complete comments without truncation
+    comments_str = comments if comments else ""
+
+    # Process abstract - show complete abstract without truncation
+    abstract_clean = abstract.replace('\n', ' ').strip() if abstract else ""
+    abstract_str = abstract_clean
+
+    # Store the parsed fields so rendering does not need to parse them again
+    paper = {'date': str(paper_date),
+             'title': paper_title,
+             'last_author': paper_last_author,
+             'categories': categories_str,
+             'paper_id': paper_key,
+             'paper_url': paper_url,
+             'comments': comments_str,
+             'abstract': abstract_str}
+    return paper_key, paper
+
+def get_daily_papers(topic, query="slam", max_results=2, start_date=None, end_date=None, show_abstract=False, cache_ttl=0):
     """
     Fetch papers from arXiv based on search criteria
     @param topic: research topic name
@@ -141,6 +321,7 @@ def get_daily_papers(topic, query="slam", max_results=2, start_date=None, end_da
     @param start_date: start date for filtering (datetime.date)
     @param end_date: end date for filtering (datetime.date)
     @param show_abstract: whether to include paper abstracts
+    @param cache_ttl: maximum age in seconds of a reusable cached response
     @return: paper data for markdown
     """
     content = dict()
@@ -148,90 +329,211 @@ def get_daily_papers(topic, query="slam", max_results=2, start_date=None, end_da
     # Build search query log information
     if start_date or end_date:
         date_range_str = f" from {start_date} to {end_date}" if start_date and end_date else f" from {start_date}" if start_date else f" until {end_date}"
-        logging.info(f"Searching arXiv for '{topic}': {query}{date_range_str}")
+        logging.info("Searching arXiv for '%s': %s%s", topic, query, date_range_str)
     else:
-        logging.info(f"Searching arXiv for '{topic}': {query}")
+        logging.info("Searching arXiv for '%s': %s", topic, query)
 
     try:
         # Build query string with date range
-        full_query = query
-        if start_date and end_date:
-            # Convert dates to arXiv API required format
-            start_str = start_date.strftime("%Y%m%d")
-            end_str = end_date.strftime("%Y%m%d")
-            full_query = f"({query}) AND submittedDate:[{start_str} TO {end_str}]"
-        elif start_date:
-            start_str = start_date.strftime("%Y%m%d")
-            full_query = f"({query}) AND submittedDate:[{start_str} TO 20301231]"
-        elif end_date:
-            end_str = end_date.strftime("%Y%m%d")
-            full_query = f"({query}) AND submittedDate:[19910101 TO {end_str}]"
-
-        # Use new arxiv API to avoid deprecation warnings
-        client = arxiv.Client()
-        search = arxiv.Search(
-            query=full_query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.SubmittedDate
-        )
+        full_query = build_query(query, start_date, end_date)
 
         papers_found = 0
 
-        for result in client.results(search):
-            paper_id = result.get_short_id()
-            paper_title = result.title
-            paper_url = result.entry_id
-            paper_authors = get_authors(result.authors)
-            paper_last_author = get_authors(result.authors, last_author=True)
-            paper_date = result.published.date()  # Use publication date
-            categories = result.categories
-            comments = result.comment
-            abstract = result.summary if show_abstract else ""
-
+        for result in fetch_results(full_query, max_results, end_date, cache_ttl):
+            paper_key, content[paper_key] = format_paper(result, show_abstract)
             papers_found += 1
 
-            # Extract paper key: eg: 2108.09112v1 -> 2108.09112
-            ver_pos = paper_id.find('v')
-            if ver_pos == -1:
-                paper_key = paper_id
-            else:
-                paper_key = paper_id[0:ver_pos]
-            paper_url = arxiv_url + 'abs/' + paper_key
-
-            # Process category information - join all categories with semicolon
-            categories_str = "; ".join(categories) if categories else ""
-
-            # Process comments - show complete comments without truncation
-            comments_str = comments if comments else ""
-
-            # Process abstract - show complete abstract without truncation
-            abstract_clean = abstract.replace('\n', ' ').strip() if abstract else ""
-            abstract_str = abstract_clean
-
-            # Table format: Date, Title, Last Author, Categories, PDF, Comments, [Abstract]
-            if show_abstract:
-                content[paper_key] = "|**{}**|**{}**|{}|{}|[{}]({})|{}|{}|\n".format(
-                    paper_date, paper_title, paper_last_author, categories_str,
-                    paper_key, paper_url, comments_str, abstract_str)
-            else:
-                content[paper_key] = "|**{}**|**{}**|{}|{}|[{}]({})|{}|\n".format(
-                    paper_date, paper_title, paper_last_author, categories_str,
-                    paper_key, paper_url, comments_str)
-
         # Clear log output
         if start_date or end_date:
-            logging.info(f"✓ Found {papers_found} papers for '{topic}' in specified date range")
+            logging.info("✓ Found %d papers for '%s' in specified date range", papers_found, topic)
         else:
-            logging.info(f"✓ Found {papers_found} papers for '{topic}'")
+            logging.info("✓ Found %d papers for '%s'", papers_found, topic)
 
     except Exception as e:
-        logging.error(f"✗ Failed to get papers for '{topic}': {e}")
+        logging.error("✗ Failed to get papers for '%s': %s", topic, e)
         papers_found = 0
 
     data = {topic: content}
 
     return data
 
+@functools.lru_cache(maxsize=None)
+def compile_filters(filters):
+    """
+    Compile search filters into one case-insensitive pattern, memoized across calls
+    @param filters: tuple of search filters
+    @return: compiled pattern matching any of the filters as whole words, with an optional plural "s"
+    """
+    # Match whole tokens like the arXiv search does, so "ROM" does not match "from".
+    # Words may be separated by any whitespace or hyphens, since abstracts are hard-wrapped
+    # and arXiv matches "physics informed" and "physics-informed" alike
+    alternatives = "|".join(r"[\s-]+".join(re.escape(word) for word in re.split(r"[\s-]+", f.strip()))
+                            for f in filters)
+    return re.compile(rf"(?<!\w)(?:{alternatives})s?(?!\w)", re.IGNORECASE)
+
+def get_daily_papers_batched(keywords, filters, max_results=2, start_date=None, end_date=None, show_abstract=False, cache_ttl=0):
+    """
+    Fetch papers for all keywords with a single union query and route them to topics
+    @param keywords: dictionary of topic name to search query string
+    @param filters: dictionary of topic name to list of search filters
+    @param max_results: maximum number of results to fetch per topic
+    @param start_date: start date for filtering (datetime.date)
+    @param end_date: end date for filtering (datetime.date)
+    @param show_abstract: whether to include paper abstracts
+    @param cache_ttl: maximum age in seconds of a reusable cached response
+    @return: list of paper data for markdown, or None if the union query is too long
+    """
+    contents = {topic: dict() for topic in keywords.keys()}
+
+    # Union all keyword queries into one query
+    query = " OR ".join(f"({keyword})" for keyword in keywords.values())
+    full_query = build_query(query, start_date, end_date)
+    if len(urllib.parse.urlencode({'search_query': full_query})) > max_query_length:
+        logging.info("Union query exceeds %d characters, searching keywords separately", max_query_length)
+        return None
+
+    # Build search query log information
+    if start_date or end_date:
+        date_range_str = f" from {start_date} to {end_date}" if start_date and end_date else f" from {start_date}" if start_date else f" until {end_date}"
+        logging.info("Searching arXiv for %d keywords in a single query%s", len(keywords), date_range_str)
+    else:
+        logging.info("Searching arXiv for %d keywords in a single query", len(keywords))
+
+    # Compile the filters of each topic once instead of lowering every filter for every paper
+    patterns = {topic: compile_filters(tuple(filters[topic])) for topic in keywords.keys()}
+
+    union_max_results = max_results * len(keywords)
+    truncated = True
+    try:
+        results = fetch_results(full_query, union_max_results, end_date, cache_ttl)
+        # A union response below its limit holds every paper of every keyword query
+        truncated = len(results) >= union_max_results
+        for result in results:
+            text = result['title'] + " " + result['summary']
+            paper = None
+            # Route the paper to every topic whose filters match
+            for topic, content in contents.items():
+                if len(content) >= max_results:
+                    continue
+                if patterns[topic].search(text):
+                    if paper is None:
+                        paper = format_paper(result, show_abstract)
+                    paper_key, content[paper_key] = paper
+
+    except Exception as e:
+        logging.error("✗ Failed to get papers for %d keywords: %s", len(keywords), e)
+
+    # Busy topics can crowd rare ones out of truncated union results, so topics that did not
+    # get their full share are searched separately to keep their own newest papers
+    short_keywords = {}
+    if truncated:
+        short_keywords = {topic: keywords[topic] for topic, content in contents.items() if len(content) < max_results}
+    if short_keywords:
+        logging.info("Searching %d keywords with fewer than %s papers separately", len(short_keywords), max_results)
+        for data in get_daily_papers_separately(short_keywords, max_results=max_results,
+                                                start_date=start_date, end_date=end_date,
+                                                show_abstract=show_abstract, cache_ttl=cache_ttl):
+            contents.update(data)
+
+    for topic, content in contents.items():
+        if topic not in short_keywords:
+            logging.info("✓ Found %d papers for '%s'", len(content), topic)
+
+    return [{topic: content} for topic, content in contents.items()]
+
+def get_daily_papers_separately(keywords, max_results=2, start_date=None, end_date=None, show_abstract=False, cache_ttl=0):
+    """
+    Fetch papers for all keywords with one query per keyword
+    @param keywords: dictionary of topic name to search query string
+    @param max_results: maximum number of results to fetch per topic
+    @param start_date: start date for filtering (datetime.date)
+    @param end_date: end date for filtering (datetime.date)
+    @param show_abstract: whether to include paper abstracts
+    @param cache_ttl: maximum age in seconds of a reusable cached response
+    @return: list of paper data for markdown
+    """
+    # The arXiv API asks for a delay between requests, which the shared client enforces,
+    # so keyword queries are sent one after another
+    return [get_daily_papers(topic, keyword, max_results, start_date, end_date, show_abstract, cache_ttl)
+            for topic, keyword in keywords.items()]
+
+def write_file_atomic(filename, content):
+    """
+    Write file through a temporary file and rename, so an interrupted write never truncates it
+    @param filename: output file path
+    @param content: bytes to write
+    """
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "wb") as f:
+        f.write(content)
+    # Keep the permissions of the file being replaced
+    if os.path.exists(filename):
+        os.chmod(tmp_filename, os.stat(filename).st_mode)
+    os.replace(tmp_filename, filename)
+
+def parse_paper_row(row):
+    """
+    Parse a paper stored as a markdown table row by previous versions
+    @param row: table row "|**date**|**title**|last author|categories|[id](url)|comments|[abstract]|"
+    @return: paper record or None if cannot parse
+    """
+    # Only the first eight columns are needed, so stop splitting after them
+    parts = row.split('|', 8)
+    if len(parts) < 7:
+        return None
+
+    # Extract PDF link and ID
+    pdf_match = _PDF_LINK_RE.search(parts[5])
+    if pdf_match:
+        paper_id = pdf_match.group(1)
+        paper_url = pdf_match.group(2)
+    else:
+        paper_id = "PDF"
+        paper_url = "#"
+
+    return {'date': parts[1].replace('**', '').strip(),
+            'title': parts[2].replace('**', '').strip(),
+            'last_author': parts[3].strip(),
+            'categories': parts[4].strip(),
+            'paper_id': paper_id,
+            'paper_url': paper_url,
+            'comments': parts[6].strip(),
+            'abstract': parts[7].strip() if len(parts) > 8 else ""}
+
+def load_json(filename):
+    """
+    Load paper data from JSON file, converting papers stored as table rows to paper records,
+    rows that cannot be parsed are kept as they are
+    @param filename: JSON file path
+    @return: dictionary of keyword to papers
+    """
+    if os.stat(filename).st_size == 0:
+        return {}
+
+    # Parse straight from the mapped file instead of copying it into a bytes object first
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                data = orjson.loads(view)
+    for keyword, papers in data.items():
+        for paper_key, paper in papers.items():
+            if isinstance(paper, str):
+                record = parse_paper_row(paper)
+                if record is None:
+                    logging.warning("Keeping unparseable paper row '%s' in '%s' as is", paper_key, keyword)
+                else:
+                    papers[paper_key] = record
+
+    return data
+
+def dump_json(filename, data):
+    """
+    Write paper data to JSON file
+    @param filename: JSON file path
+    @param data: dictionary of keyword to papers
+    """
+    write_file_atomic(filename, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
 def remove_old_keywords(json_data, current_keywords):
     """
     Remove keywords that are no longer used in the configuration
@@ -242,151 +544,305 @@ def remove_old_keywords(json_data, current_keywords):
     removed_keywords = {}
 
     # Find keywords that exist in JSON but not in current configuration
-    json_keywords = list(json_data.keys())
-    current_keyword_names = list(current_keywords.keys())
-
-    keywords_to_remove = [kw for kw in json_keywords if kw not in current_keyword_names]
+    keywords_to_remove = json_data.keys() - current_keywords.keys()
 
     for keyword in keywords_to_remove:
-        removed_papers_count = len(json_data[keyword])
+        removed_papers_count = len(json_data.pop(keyword))
         removed_keywords[keyword] = removed_papers_count
-        del json_data[keyword]
-        logging.info(f"  Removed keyword '{keyword}' with {removed_papers_count} papers")
+        logging.info("  Removed keyword '%s' with %d papers", keyword, removed_papers_count)
 
     return json_data, removed_keywords
 
-def update_json_file(filename, data_dict, current_keywords, clear_existing=False):
+def cleanup_and_update(filename, data_dict, current_keywords, keep_days=0, clear_existing=False, today=None):
     '''
-    Update JSON file with new paper data
+    Clean up old papers and update JSON file with new paper data, reading the file once and writing it only if changed
     @param filename: JSON file path
-    @param data_dict: dictionary containing new paper data
+    @param data_dict: dictionary of keyword to new papers
     @param current_keywords: current keywords from configuration
+    @param keep_days: number of days to keep, no cleanup if not positive
     @param clear_existing: whether to clear existing content (when using date range)
-    @return: tuple of (existing_count, updated_count, new_papers_count, category_updates)
+    @param today: date the cleanup cutoff is counted from, defaults to today
+    @return: tuple of (existing_count, updated_count, new_papers_count, category_updates, json_data),
+             existing_count is counted after cleanup
     '''
+    # Whether the file content differs from what is stored, an unchanged file is not rewritten
+    changed = True
+
     # If clear_existing is specified, create an empty dictionary
     if clear_existing:
-        m = {}
+        json_data = {}
         existing_count = 0
-        logging.info(f"Clearing existing data in {filename} due to custom date range")
+        logging.info("Clearing existing data in %s due to custom date range", filename)
     else:
-        # Otherwise load existing data normally
-        with open(filename, "r") as f:
-            content = f.read()
-            if not content:
-                m = {}
-                existing_count = 0
-            else:
-                m = json.loads(content)
-                existing_count = sum(len(papers) for papers in m.values())
+        # Otherwise load existing data normally - the freshly parsed dictionary is updated in place
+        try:
+            json_data = load_json(filename)
+            changed = False
+        except FileNotFoundError:
+            json_data = {}
+        if keep_days > 0:
+            before_cleanup, existing_count = cleanup_old_papers(json_data, keep_days, today)
+            changed = changed or existing_count != before_cleanup
+        else:
+            existing_count = sum(len(papers) for papers in json_data.values())
 
-    json_data = m.copy()
+    # Keep the total paper count up to date instead of recounting at the end
+    updated_count = existing_count
 
     # Remove unused keywords (only execute when not clearing)
     if not clear_existing and existing_count > 0:
         json_data, removed_keywords = remove_old_keywords(json_data, current_keywords)
         if removed_keywords:
+            changed = True
             total_removed = sum(removed_keywords.values())
-            logging.info(f"✓ Removed {len(removed_keywords)} old keywords with {total_removed} papers")
+            updated_count -= total_removed
+            logging.info("✓ Removed %d old keywords with %d papers", len(removed_keywords), total_removed)
 
     # Update papers for each keyword
     new_papers_count = 0
     category_updates = {}
-    for data in data_dict:
-        for keyword in data.keys():
-            papers = data[keyword]
-            new_papers_count += len(papers)
-
-            if keyword in json_data.keys():
-                # If clearing existing content, replace directly instead of updating
-                if clear_existing:
-                    json_data[keyword] = papers
-                    category_updates[keyword] = len(papers)
-                else:
-                    # Calculate actual number of new papers (deduplicated)
-                    before_count = len(json_data[keyword])
-                    json_data[keyword].update(papers)
-                    after_count = len(json_data[keyword])
-                    added_count = after_count - before_count
-                    if added_count > 0:
-                        category_updates[keyword] = added_count
-            else:
-                json_data[keyword] = papers
-                category_updates[keyword] = len(papers)
-
-    with open(filename, "w") as f:
-        json.dump(json_data, f)
-
-    updated_count = sum(len(papers) for papers in json_data.values())
-    return existing_count, updated_count, new_papers_count, category_updates
-
-def parse_date_from_content(paper_content):
-    """
-    Parse date from paper content, supporting multiple formats
-    @param paper_content: paper content string
-    @return: parsed date or None if cannot parse
-    """
-    try:
-        # Format: Table format "|2022-01-19|Title|..."
-        if '|' in paper_content:
-            parts = paper_content.split('|')
-            if len(parts) >= 3:
-                date_str = parts[1].strip().replace('**', '')
-                return datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
+    for keyword, papers in data_dict.items():
+        new_papers_count += len(papers)
+        existing_papers = json_data.get(keyword)
+
+        # When clearing existing content, json_data starts empty, so every keyword is new
+        if existing_papers is not None:
+            # Papers fetched again may come with updated metadata
+            if not changed:
+                changed = any(existing_papers.get(paper_key) != paper
+                              for paper_key, paper in papers.items())
+            # Actual new papers (deduplicated) are the keys not yet stored
+            added = papers.keys() - existing_papers.keys()
+            existing_papers.update(papers)
+            if added:
+                updated_count += len(added)
+                category_updates[keyword] = len(added)
+        else:
+            changed = True
+            json_data[keyword] = dict(papers)
+            updated_count += len(papers)
+            category_updates[keyword] = len(papers)
 
-        return None
+    if changed:
+        dump_json(filename, json_data)
+    else:
+        logging.info("✓ No changes to %s, skipping write", filename)
 
-    except Exception as e:
-        return None
+    return existing_count, updated_count, new_papers_count, category_updates, json_data
 
-def cleanup_old_papers(filename, keep_days):
+def cleanup_old_papers(data, keep_days, today=None):
     """
-    Clean up JSON file, keeping only papers from recent keep_days
-    @param filename: JSON file path
+    Clean up paper data in place, keeping only papers from recent keep_days
+    @param data: dictionary of keyword to papers
     @param keep_days: number of days to keep
+    @param today: date the cutoff is counted from, defaults to today
     @return: tuple of (total_papers_before, total_papers_after)
     """
     if keep_days <= 0:
         return 0, 0
 
-    cutoff_date = datetime.datetime.now().date() - datetime.timedelta(days=keep_days)
-    logging.info(f"Cleaning up papers older than {cutoff_date} (keeping {keep_days} days)")
+    cutoff_date = (today or datetime.date.today()) - datetime.timedelta(days=keep_days)
+    logging.info("Cleaning up papers older than %s (keeping %s days)", cutoff_date, keep_days)
 
-    with open(filename, "r") as f:
-        content = f.read()
-        if not content:
-            logging.info("Empty file, nothing to clean")
-            return 0, 0
-        data = json.loads(content)
+    if not data:
+        logging.info("No papers, nothing to clean")
+        return 0, 0
 
     total_papers_before = sum(len(papers) for papers in data.values())
-    logging.info(f"Papers before cleanup: {total_papers_before}")
+    logging.info("Papers before cleanup: %d", total_papers_before)
+
+    # Dates are stored as ISO "YYYY-MM-DD" strings, which compare in date order
+    cutoff_str = cutoff_date.isoformat()
 
-    papers_removed = 0
-    papers_kept = 0
+    def is_recent(paper_content):
+        if not isinstance(paper_content, dict):
+            return True
+        paper_date = paper_content.get('date')
+        # Keep papers without a comparable date
+        return not isinstance(paper_date, str) or len(paper_date) != 10 or paper_date >= cutoff_str
 
+    # Filter each category in a single pass
     for category, papers in data.items():
-        papers_to_keep = {}
-        for paper_id, paper_content in papers.items():
-            paper_date = parse_date_from_content(paper_content)
+        data[category] = {paper_id: paper_content for paper_id, paper_content in papers.items()
+                          if is_recent(paper_content)}
 
-            if paper_date is None or paper_date >= cutoff_date:
-                papers_to_keep[paper_id] = paper_content
-                papers_kept += 1
+    total_papers_after = sum(len(papers) for papers in data.values())
+    papers_kept = total_papers_after
+    papers_removed = total_papers_before - total_papers_after
+    logging.info("✓ Cleanup completed: %d papers kept, %d papers removed", papers_kept, papers_removed)
+    logging.info("  Papers after cleanup: %d", total_papers_after)
+
+    return total_papers_before, total_papers_after
+
+def pretty_math(s: str) -> str:
+    """
+    Format LaTeX math expressions for better display
+    @param s: string containing math expressions
+    @return: formatted string
+    """
+    match = _MATH_RE.search(s)
+    if match is None:
+        return s
+
+    math_start, math_end = match.span()
+    math_content = match.group()[1:-1]  # Remove $ signs
+
+    # Process the part before math
+    before_math = s[:math_start]
+    # Process the part after math
+    after_math = s[math_end:]
+
+    # Check if we need to add spaces around the math expression
+    space_before = ''
+    space_after = ''
+
+    # Check character before math (if exists)
+    if before_math and not before_math[-1].isspace() and before_math[-1] != '*':
+        space_before = ' '
+
+    # Check character after math (if exists), punctuation stays attached
+    if after_math and not after_math[0].isspace() and after_math[0] not in string.punctuation:
+        space_after = ' '
+
+    # Reconstruct the string with proper spacing
+    return f"{before_math}{space_before}${math_content.strip()}${space_after}{after_math}"
+
+def format_paper_item(paper, paper_index, show_abstract=False):
+    """
+    Render one paper as a styled list item for README
+    @param paper: paper record
+    @param paper_index: 1-based position of the paper in its list, used for alternating classes
+    @param show_abstract: whether to show paper abstract
+    @return: rendered HTML block
+    """
+    date = paper['date']
+    title = paper['title']
+    last_author = paper['last_author']
+    categories = paper['categories']
+    paper_id = paper['paper_id']
+    paper_url = paper['paper_url']
+    comments = paper['comments']
+    abstract = paper['abstract']
+
+    item_class = "paper-item-odd" if paper_index % 2 == 1 else "paper-item-even"
+
+    # Header with title and date
+    lines = [f'<div class="paper-item {item_class}">\n',
+             '  <div class="paper-header">\n',
+             f'    <div class="paper-title">{pretty_math(title)}</div>\n',
+             f'    <div class="paper-date">{date}</div>\n',
+             '  </div>\n']
+
+    # Authors with "last author:" label
+    if last_author:
+        lines.append(f'  <div class="paper-authors">{last_author} (last author)</div>\n')
+
+    # Metadata: categories and PDF link
+    lines.append('  <div class="paper-meta">\n')
+    if categories:
+        lines.append(f'    <span class="paper-categories">{categories}</span>\n')
+    lines.append(f'    <a class="paper-link" href="{paper_url}" target="_blank">📄 PDF: {paper_id}</a>\n')
+    lines.append('  </div>\n')
+
+    # Comments - show complete comments without truncation
+    if comments:
+        lines.append(f'  <div class="paper-comments">💬 {comments}</div>\n')
+
+    # Abstract (if enabled and available) - show complete abstract without truncation
+    if show_abstract and abstract:
+        lines.append('  <div class="paper-abstract">\n')
+        lines.append('    <div class="abstract-label">📖 Abstract:</div>\n')
+        lines.append(f'    {pretty_math(abstract)}\n')
+        lines.append('  </div>\n')
+
+    lines.append('</div>\n')
+    return ''.join(lines)
+
+def format_paper_row(paper, show_abstract=False):
+    """
+    Render one paper as a Markdown table row for GitPage
+    @param paper: paper record
+    @param show_abstract: whether to add the abstract column
+    @return: rendered table row
+    """
+    row_template = _ROW_ABSTRACT_TEMPLATE if show_abstract else _ROW_TEMPLATE
+    return pretty_math(row_template.format_map(paper))
+
+def render_section(keyword, day_content, to_web=False, use_title=True, show_abstract=False):
+    """
+    Render the heading and paper list of one keyword
+    @param keyword: keyword name
+    @param day_content: dictionary of papers of the keyword
+    @param to_web: whether generating for web
+    @param use_title: whether to use title
+    @param show_abstract: whether to show paper abstracts
+    @return: rendered Markdown block
+    """
+    chunks = []
+    append = chunks.append
+
+    # The head of each part
+    append(f"## {keyword}\n\n")
+
+    # Sort papers by date
+    day_content = sort_papers(day_content)
+
+    # Start paper list
+    if to_web == False:  # For README, use styled list
+        append('<div class="paper-list">\n')
+        
+        paper_index = 0
+        day_content_list = list(day_content.items())
+        for paper_key, paper in day_content_list:
+            # Unparseable legacy rows have no fields to show in the styled list
+            if isinstance(paper, dict):
+                # Create styled list item with alternating classes
+                paper_index += 1
+                append(format_paper_item(paper, paper_index, show_abstract))
+
+                # Add extra space between papers (except for the last one)
+                if paper_index < len(day_content_list):
+                    append('<div style="height: 10px;"></div>\n')
+        
+        append('</div>\n\n')
+        
+    else:  # For web (GitPage), keep original format
+        if use_title == True:
+            if to_web == False:
+                if show_abstract:
+                    append("|Publish Date|Title|Last Author|Categories|PDF|Comments|Abstract|\n")
+                    append("|---|---|---|---|---|---|---|\n")
+                else:
+                    append("|Publish Date|Title|Last Author|Categories|PDF|Comments|\n")
+                    append("|---|---|---|---|---|---|\n")
             else:
-                papers_removed += 1
+                if show_abstract:
+                    append("| Publish Date | Title | Last Author | Categories | PDF | Comments | Abstract |\n")
+                    append("|:---------|:-----------------------|:---------|:----------|:------|:----------|:----------|\n")
+                else:
+                    append("| Publish Date | Title | Last Author | Categories | PDF | Comments |\n")
+                    append("|:---------|:-----------------------|:---------|:----------|:------|:----------|\n")
 
-        data[category] = papers_to_keep
+        for _, paper in day_content.items():
+            if isinstance(paper, str):
+                # Unparseable legacy rows are printed as they are
+                append(pretty_math(paper))
+            elif paper is not None:
+                append(format_paper_row(paper, show_abstract))
 
-    # Write back to file
-    with open(filename, "w") as f:
-        json.dump(data, f)
+        append(f"\n")
 
-    total_papers_after = sum(len(papers) for papers in data.values())
-    logging.info(f"✓ Cleanup completed: {papers_kept} papers kept, {papers_removed} papers removed")
-    logging.info(f"  Papers after cleanup: {total_papers_after}")
+    return ''.join(chunks)
 
-    return total_papers_before, total_papers_after
+def output_cache_file(filename, suffix):
+    """
+    Get the cache file path belonging to an output file
+    @param filename: output file path
+    @param suffix: suffix of the cache file
+    @return: cache file path, keyed by the full output path so outputs sharing a name do not collide
+    """
+    key = hashlib.sha1(os.path.abspath(filename).encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(filename)}.{key}{suffix}")
 
 def json_to_md(filename, md_filename,
                task='',
@@ -394,7 +850,8 @@ def json_to_md(filename, md_filename,
                use_title=True,
                use_tc=True,
                use_b2t=True,
-               show_abstract=False):
+               show_abstract=False,
+               data=None):
     """
     Convert JSON data to Markdown format
     @param filename: input JSON file path
@@ -405,85 +862,43 @@ def json_to_md(filename, md_filename,
     @param use_tc: whether to use table of contents
     @param use_b2t: whether to use back to top
     @param show_abstract: whether to show paper abstracts
+    @param data: already loaded JSON data, read from filename if not given
     """
-    def pretty_math(s: str) -> str:
-        """
-        Format LaTeX math expressions for better display
-        @param s: string containing math expressions
-        @return: formatted string
-        """
-        ret = ''
-        match = re.search(r"\$.*\$", s)
-        if match is None:
-            return s
-            
-        math_start, math_end = match.span()
-        math_content = match.group()[1:-1]  # Remove $ signs
-        
-        # Process the part before math
-        before_math = s[:math_start]
-        # Process the part after math
-        after_math = s[math_end:]
-        
-        # Check if we need to add spaces around the math expression
-        space_before = ''
-        space_after = ''
-        
-        # Check character before math (if exists)
-        if before_math and not before_math[-1].isspace() and before_math[-1] != '*':
-            space_before = ' '
-            
-        # Check character after math (if exists)
-        if after_math and not after_math[0].isspace() and after_math[0] != '*':
-            space_after = ' '
-        
-        # Reconstruct the string with proper spacing
-        ret = before_math + space_before + '$' + math_content.strip() + '$' + space_after + after_math
-        return ret
-
     DateNow = datetime.date.today()
     DateNow = str(DateNow)
     DateNow = DateNow.replace('-', '.')
 
-    with open(filename, "r") as f:
-        content = f.read()
-        if not content:
-            data = {}
-            total_papers = 0
-        else:
-            data = json.loads(content)
-            total_papers = sum(len(papers) for papers in data.values())
-
-    # Clean README.md if it exists, otherwise create it
-    with open(md_filename, "w+") as f:
-        pass
+    if data is None:
+        data = load_json(filename)
+    total_papers = sum(len(papers) for papers in data.values())
 
-    # Write data into README.md
-    with open(md_filename, "a+") as f:
+    # Keywords with papers, shared by the table of contents and the sections
+    sections = [(keyword, papers) for keyword, papers in data.items() if papers]
 
-        if (use_title == True) and (to_web == True):
-            f.write("---\n" + "layout: default\n" + "---\n\n")
+    # Collect the whole Markdown document and write it at once
+    chunks = []
+    append = chunks.append
 
-        if use_title == True:
-            f.write("## Updated on " + DateNow + "\n")
-        else:
-            f.write("> Updated on " + DateNow + "\n")
-
-        # Add: table of contents (without folding)
-        if use_tc == True:
-            f.write("## Table of Contents\n")
-            f.write("<ol>\n")
-            for keyword in data.keys():
-                day_content = data[keyword]
-                if not day_content:
-                    continue
-                kw = keyword.replace(' ', '-')
-                f.write(f"<li><a href=#{kw.lower()}>{keyword}</a></li>\n")
-            f.write("</ol>\n\n")
+    if (use_title == True) and (to_web == True):
+        append("---\n" + "layout: default\n" + "---\n\n")
 
-        # Add CSS for alternating row colors
-        if to_web == False:  # Only for README, not for web
-            f.write("""
+    if use_title == True:
+        append("## Updated on " + DateNow + "\n")
+    else:
+        append("> Updated on " + DateNow + "\n")
+
+    # Add: table of contents (without folding)
+    if use_tc == True:
+        append("## Table of Contents\n")
+        append("<ol>\n")
+        for keyword, _ in sections:
+            kw = keyword.replace(' ', '-')
+            append(f"<li><a href=#{kw.lower()}>{keyword}</a></li>\n")
+        append("</ol>\n\n")
+
+    # Add CSS for alternating row colors
+    if to_web == False:  # Only for README, not for web
+        append("""
 <style>
 .paper-list {
     list-style-type: none;
@@ -571,138 +986,121 @@ def json_to_md(filename, md_filename,
 
 """)
 
-        for keyword in data.keys():
-            day_content = data[keyword]
-            if not day_content:
-                continue
-            # The head of each part
-            f.write(f"## {keyword}\n\n")
-
-            # Sort papers by date
-            day_content = sort_papers(day_content)
-
-            # Start paper list
-            if to_web == False:  # For README, use styled list
-                f.write('<div class="paper-list">\n')
-                
-                paper_index = 0
-                day_content_list = list(day_content.items())
-                for paper_key, v in day_content_list:
-                    if v is not None:
-                        # Parse the table row to extract paper information
-                        parts = v.strip().split('|')
-                        if len(parts) >= 7:
-                            # Adjust index based on whether abstract is included
-                            if show_abstract and len(parts) >= 8:
-                                date = parts[1].replace('**', '').strip()
-                                title = parts[2].replace('**', '').strip()
-                                last_author = parts[3].strip()
-                                categories = parts[4].strip()
-                                pdf_link = parts[5].strip()
-                                comments = parts[6].strip()
-                                abstract = parts[7].strip()
-                            else:
-                                date = parts[1].replace('**', '').strip()
-                                title = parts[2].replace('**', '').strip()
-                                last_author = parts[3].strip()
-                                categories = parts[4].strip()
-                                pdf_link = parts[5].strip()
-                                comments = parts[6].strip()
-                                abstract = ""
-                            
-                            # Extract PDF link and ID
-                            pdf_match = re.search(r'\[(.*?)\]\((.*?)\)', pdf_link)
-                            if pdf_match:
-                                paper_id = pdf_match.group(1)
-                                paper_url = pdf_match.group(2)
-                            else:
-                                paper_id = "PDF"
-                                paper_url = "#"
-                            
-                            # Create styled list item with alternating classes
-                            paper_index += 1
-                            item_class = "paper-item-odd" if paper_index % 2 == 1 else "paper-item-even"
-                            f.write(f'<div class="paper-item {item_class}">\n')
-                            
-                            # Header with title and date
-                            f.write('  <div class="paper-header">\n')
-                            f.write(f'    <div class="paper-title">{pretty_math(title)}</div>\n')
-                            f.write(f'    <div class="paper-date">{date}</div>\n')
-                            f.write('  </div>\n')
-                            
-                            # Authors with "last author:" label
-                            if last_author:
-                                f.write(f'  <div class="paper-authors">{last_author} (last author)</div>\n')
-                            
-                            # Metadata: categories and PDF link
-                            f.write('  <div class="paper-meta">\n')
-                            if categories:
-                                f.write(f'    <span class="paper-categories">{categories}</span>\n')
-                            f.write(f'    <a class="paper-link" href="{paper_url}" target="_blank">📄 PDF: {paper_id}</a>\n')
-                            f.write('  </div>\n')
-                            
-                            # Comments - show complete comments without truncation
-                            if comments and comments != "":
-                                f.write(f'  <div class="paper-comments">💬 {comments}</div>\n')
-                            
-                            # Abstract (if enabled and available) - show complete abstract without truncation
-                            if show_abstract and abstract and abstract != "":
-                                f.write(f'  <div class="paper-abstract">\n')
-                                f.write(f'    <div class="abstract-label">📖 Abstract:</div>\n')
-                                f.write(f'    {pretty_math(abstract)}\n')
-                                f.write(f'  </div>\n')
-                            
-                            f.write('</div>\n')
-                            
-                            # Add extra space between papers (except for the last one)
-                            if paper_index < len(day_content_list):
-                                f.write('<div style="height: 10px;"></div>\n')
-                
-                f.write('</div>\n\n')
-                
-            else:  # For web (GitPage), keep original format
-                if use_title == True:
-                    if to_web == False:
-                        if show_abstract:
-                            f.write("|Publish Date|Title|Last Author|Categories|PDF|Comments|Abstract|\n")
-                            f.write("|---|---|---|---|---|---|---|\n")
-                        else:
-                            f.write("|Publish Date|Title|Last Author|Categories|PDF|Comments|\n")
-                            f.write("|---|---|---|---|---|---|\n")
-                    else:
-                        if show_abstract:
-                            f.write("| Publish Date | Title | Last Author | Categories | PDF | Comments | Abstract |\n")
-                            f.write("|:---------|:-----------------------|:---------|:----------|:------|:----------|:----------|\n")
-                        else:
-                            f.write("| Publish Date | Title | Last Author | Categories | PDF | Comments |\n")
-                            f.write("|:---------|:-----------------------|:---------|:----------|:------|:----------|\n")
-
-                for _, v in day_content.items():
-                    if v is not None:
-                        f.write(pretty_math(v))
-
-                f.write(f"\n")
-
-            # Add: back to top
-            if use_b2t:
-                top_info = f"#Updated on {DateNow}"
-                top_info = top_info.replace(' ', '-').replace('.', '')
-                f.write(f"<p align=right>(<a href={top_info.lower()}>back to top</a>)</p>\n\n")
-
-    logging.info(f"✓ {task} generation finished - Generated Markdown with {total_papers} papers")
+    # Reuse the rendered blocks of keywords whose papers and options are unchanged since the last run
+    blocks_file = output_cache_file(md_filename, '.blocks.pkl')
+    cached_blocks = {}
+    if os.path.exists(blocks_file):
+        try:
+            with open(blocks_file, "rb") as f:
+                cached_blocks = pickle.load(f)
+        except Exception as e:
+            logging.warning("Ignoring unreadable cache file %s: %s", blocks_file, e)
+
+    options = orjson.dumps([render_version, to_web, use_title, show_abstract])
+    blocks = {}
+    for keyword, day_content in sections:
+        digest = hashlib.blake2b(orjson.dumps(day_content) + options, digest_size=16).digest()
+        cached = cached_blocks.get(keyword)
+        if cached is not None and cached[0] == digest:
+            block = cached[1]
+        else:
+            block = render_section(keyword, day_content, to_web=to_web, use_title=use_title,
+                                   show_abstract=show_abstract)
+        blocks[keyword] = (digest, block)
+        append(block)
+
+        # Add: back to top
+        if use_b2t:
+            top_info = f"#Updated on {DateNow}"
+            top_info = top_info.replace(' ', '-').replace('.', '')
+            append(f"<p align=right>(<a href={top_info.lower()}>back to top</a>)</p>\n\n")
+
+    # Write data into README.md, replacing any previous content
+    write_file_atomic(md_filename, ''.join(chunks).encode('utf-8'))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    write_file_atomic(blocks_file, pickle.dumps(blocks, protocol=pickle.HIGHEST_PROTOCOL))
+
+    logging.info("✓ %s generation finished - Generated Markdown with %d papers", task, total_papers)
+
+def json_to_md_if_changed(filename, md_filename, data=None, **kwargs):
+    """
+    Convert JSON data to Markdown format unless the JSON data and options are unchanged since the last conversion
+    @param filename: input JSON file path
+    @param md_filename: output Markdown file path
+    @param data: already loaded JSON data, read from filename if not given
+    @param kwargs: options passed to json_to_md
+    @return: whether the Markdown file was generated
+    """
+    if data is None:
+        data = load_json(filename)
+    # Hash the data in memory instead of reading back the file just written, keyword order is kept.
+    # The render version makes an upgrade that changes the rendering regenerate the file
+    digest = hashlib.blake2b(orjson.dumps(data) + orjson.dumps([render_version, kwargs], option=orjson.OPT_SORT_KEYS),
+                             digest_size=16).hexdigest()
+
+    hash_file = output_cache_file(md_filename, '.hash')
+    if os.path.exists(md_filename) and os.path.exists(hash_file):
+        with open(hash_file, "r") as f:
+            if f.read() == digest:
+                logging.info("✓ %s unchanged, skipping Markdown generation", kwargs.get('task', ''))
+                return False
+
+    json_to_md(filename, md_filename, data=data, **kwargs)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    write_file_atomic(hash_file, digest.encode())
+    return True
+
+def run_pipeline(task, json_file, md_file, data_collector, keywords, cleanup_days=0, date_range_enabled=False, today=None, **md_options):
+    """
+    Update one JSON file with the collected papers and generate its Markdown file
+    @param task: name of the output, e.g. README or GitPage
+    @param json_file: JSON file path
+    @param md_file: Markdown file path
+    @param data_collector: dictionary of keyword to new papers
+    @param keywords: current keywords from configuration
+    @param cleanup_days: number of days to keep, no cleanup if not positive
+    @param date_range_enabled: whether a custom date range is used, existing content is replaced
+    @param today: date the cleanup cutoff is counted from
+    @param md_options: options passed to json_to_md
+    """
+    logging.info("-" * 40)
+    logging.info("UPDATING %s", task.upper())
+    logging.info("-" * 40)
+
+    # Clean up and update JSON data in one pass - clear existing content if date range is enabled
+    existing_count, updated_count, new_count, category_updates, json_data = cleanup_and_update(
+        json_file, data_collector, keywords, keep_days=cleanup_days, clear_existing=date_range_enabled, today=today)
+
+    # Print update status for all categories as one record, skipped when INFO messages are disabled
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        summary = '\n'.join(f"  Added {added_count} new papers to '{category}'"
+                             for category, added_count in category_updates.items() if added_count > 0)
+        if summary:
+            logging.info("%s category updates:\n%s", task, summary)
+
+    if date_range_enabled:
+        logging.info("✓ %s JSON replaced with %d papers from date range", task, updated_count)
+    else:
+        logging.info("✓ %s JSON updated: %d new papers added", task, updated_count - existing_count)
+        logging.info("  Total papers in %s: %d", task, updated_count)
+
+    # Generate Markdown from the already updated data
+    json_to_md_if_changed(json_file, md_file, data=json_data, task=task, **md_options)
 
 def demo(**config):
     """
     Main function to fetch papers and update output files
     @param config: configuration dictionary
     """
-    data_collector = []
-
     keywords = config['kv']
+    filters = {topic: v['filters'] for topic, v in config['keywords'].items()}
     max_results = config['max_results']
     publish_readme = config['publish_readme']
     publish_gitpage = config['publish_gitpage']
     show_abstract = config.get('show_abstract', False)
+    cache_ttl = config.get('cache_ttl_seconds', 0)
 
     cleanup_enabled = config['cleanup']['enabled']
     keep_days = config['cleanup']['keep_days']
@@ -717,116 +1115,52 @@ def demo(**config):
 
     if date_range_enabled:
         date_range_str = f"{start_date} to {end_date}" if start_date and end_date else f"from {start_date}" if start_date else f"until {end_date}"
-        logging.info(f"Custom date range: {date_range_str}")
-        logging.info(f"Processing {len(keywords)} keywords with max {max_results} papers each in specified date range")
+        logging.info("Custom date range: %s", date_range_str)
+        logging.info("Processing %d keywords with max %s papers each in specified date range", len(keywords), max_results)
         logging.info("Will clear existing JSON content and replace with papers from date range")
     else:
-        logging.info(f"Processing {len(keywords)} keywords with max {max_results} papers each")
+        logging.info("Processing %d keywords with max %s papers each", len(keywords), max_results)
         if cleanup_enabled:
-            logging.info(f"Cleanup enabled: keeping {keep_days} days of papers")
+            logging.info("Cleanup enabled: keeping %s days of papers", keep_days)
+
+    logging.info("Show abstract: %s", show_abstract)
 
-    logging.info(f"Show abstract: {show_abstract}")
+    # Fetch new papers - a single union query when possible, otherwise one query per keyword
+    # Pass date range parameters and show_abstract
+    data_collector = get_daily_papers_batched(keywords, filters, max_results=max_results,
+                                              start_date=start_date, end_date=end_date,
+                                              show_abstract=show_abstract, cache_ttl=cache_ttl)
+    if data_collector is None:
+        data_collector = get_daily_papers_separately(keywords, max_results=max_results,
+                                                     start_date=start_date, end_date=end_date,
+                                                     show_abstract=show_abstract, cache_ttl=cache_ttl)
 
-    # Fetch new papers
-    total_new_papers = 0
-    for topic, keyword in keywords.items():
-        # Pass date range parameters and show_abstract
-        data = get_daily_papers(topic, query=keyword, max_results=max_results,
-                               start_date=start_date, end_date=end_date,
-                               show_abstract=show_abstract)
+    # Merge the per-keyword results once, both outputs are updated from the same formatted records
+    data_collector = {keyword: papers for data in data_collector for keyword, papers in data.items()}
+    total_new_papers = sum(len(papers) for papers in data_collector.values())
 
-        if topic in data and data[topic]:
-            papers_count = len(data[topic])
-            total_new_papers += papers_count
+    logging.info("✓ Collected %d new papers from arXiv", total_new_papers)
 
-        data_collector.append(data)
+    # Only perform cleanup if custom date range is not enabled and cleanup is enabled,
+    # both outputs count the cutoff from the same date even if the run crosses midnight
+    today = datetime.date.today()
+    cleanup_days = keep_days if cleanup_enabled and not date_range_enabled else 0
 
-    logging.info(f"✓ Collected {total_new_papers} new papers from arXiv")
+    # Skip cleanup if date range is enabled
+    if date_range_enabled:
+        logging.info("Skipping cleanup due to custom date range")
 
     # 1. Update README.md file
     if publish_readme:
-        logging.info("-" * 40)
-        logging.info("UPDATING README")
-        logging.info("-" * 40)
-
-        json_file = config['json_readme_path']
-        md_file = config['md_readme_path']
-
-        # Check if JSON file exists
-        json_exists = os.path.exists(json_file)
-
-        # Only perform cleanup if custom date range is not enabled and cleanup is enabled
-        if cleanup_enabled and not date_range_enabled and json_exists:
-            before_cleanup, after_cleanup = cleanup_old_papers(json_file, keep_days)
-        else:
-            # Skip cleanup if date range is enabled
-            if date_range_enabled:
-                logging.info("Skipping cleanup due to custom date range")
-            # Get current paper count
-            if json_exists and not date_range_enabled:
-                with open(json_file, "r") as f:
-                    content = f.read()
-                    if content:
-                        existing_data = json.loads(content)
-                        after_cleanup = sum(len(papers) for papers in existing_data.values())
-                    else:
-                        after_cleanup = 0
-            else:
-                after_cleanup = 0
-
-        # Update JSON data - clear existing content if date range is enabled
-        existing_count, updated_count, new_count, category_updates = update_json_file(
-            json_file, data_collector, keywords, clear_existing=date_range_enabled)
-
-        # Print update status for each category
-        for category, added_count in category_updates.items():
-            if added_count > 0:
-                logging.info(f"  Added {added_count} new papers to '{category}'")
-
-        if date_range_enabled:
-            logging.info(f"✓ README JSON replaced with {updated_count} papers from date range")
-        else:
-            actual_added = updated_count - after_cleanup
-            logging.info(f"✓ README JSON updated: {actual_added} new papers added")
-            logging.info(f"  Total papers in README: {updated_count}")
-
-        # Generate Markdown with show_abstract parameter
-        json_to_md(json_file, md_file, task='README', show_abstract=show_abstract)
+        run_pipeline('README', config['json_readme_path'], config['md_readme_path'],
+                     data_collector, keywords, cleanup_days, date_range_enabled, today,
+                     show_abstract=show_abstract)
 
-    # 2. Update docs/gitpage.md file (for gitpage)
+    # 2. Update docs/gitpage.md file (for gitpage) - GitPage doesn't show abstract for now
     if publish_gitpage:
-        logging.info("-" * 40)
-        logging.info("UPDATING GITPAGE")
-        logging.info("-" * 40)
-
-        json_file = config['json_gitpage_path']
-        md_file = config['md_gitpage_path']
-
-        # Check if JSON file exists
-        json_exists = os.path.exists(json_file)
-
-        # Only perform cleanup if custom date range is not enabled and cleanup is enabled
-        if cleanup_enabled and not date_range_enabled and json_exists:
-            before_cleanup, after_cleanup = cleanup_old_papers(json_file, keep_days)
-
-        # Update JSON data - clear existing content if date range is enabled
-        existing_count, updated_count, new_count, category_updates = update_json_file(
-            json_file, data_collector, keywords, clear_existing=date_range_enabled)
-
-        # Print update status for each category
-        for category, added_count in category_updates.items():
-            if added_count > 0:
-                logging.info(f"  Added {added_count} new papers to '{category}'")
-
-        if date_range_enabled:
-            logging.info(f"✓ GitPage JSON replaced with {updated_count} papers from date range")
-        else:
-            logging.info(f"✓ GitPage JSON updated: {updated_count - existing_count} new papers added")
-            logging.info(f"  Total papers in GitPage: {updated_count}")
-
-        # Generate Markdown - GitPage doesn't show abstract for now
-        json_to_md(json_file, md_file, task='GitPage',
-                  to_web=True, use_tc=False, use_b2t=False, show_abstract=False)
+        run_pipeline('GitPage', config['json_gitpage_path'], config['md_gitpage_path'],
+                     data_collector, keywords, cleanup_days, date_range_enabled, today,
+                     to_web=True, use_tc=False, use_b2t=False, show_abstract=False)
 
     logging.info("=" * 60)
     logging.info("PROCESS COMPLETED SUCCESSFULLY")
@@ -0,0 +1,49 @@
+import datetime
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+# The script name contains a hyphen, so load it by path
+_spec = importlib.util.spec_from_file_location(
+    'arxiv_daily', os.path.join(os.path.dirname(__file__), '..', 'arxiv-daily.py'))
+arxiv_daily = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(arxiv_daily)
+
+
+class CompileFiltersTest(unittest.TestCase):
+
+    def test_phrase_wrapped_across_lines(self):
+        pattern = arxiv_daily.compile_filters(("reduced order model",))
+        self.assertIsNotNone(pattern.search("a reduced\norder model"))
+
+    def test_hyphen_matches_space_and_line_break(self):
+        pattern = arxiv_daily.compile_filters(("physics-informed neural networks",))
+        self.assertIsNotNone(pattern.search("physics-informed neural\nnetworks"))
+        self.assertIsNotNone(pattern.search("physics informed neural networks"))
+
+    def test_whole_words_only(self):
+        pattern = arxiv_daily.compile_filters(("ROM", "PINN", "POD"))
+        self.assertIsNone(pattern.search("from a spinning disk on a tripod"))
+        self.assertIsNotNone(pattern.search("PINNs for ROM-based (POD) models"))
+
+
+class BatchedRoutingTest(unittest.TestCase):
+
+    def test_wrapped_abstract_is_routed(self):
+        result = {'id': '2610.00001v1',
+                  'title': 'A solver',
+                  'authors': ['Alice', 'Bob'],
+                  'published': datetime.date(2026, 10, 1),
+                  'categories': ['cs.LG'],
+                  'comment': None,
+                  'summary': 'We train physics-informed neural\nnetworks on a wrapped line.'}
+        keywords = {'PINN': '"physics-informed neural networks" OR PINN'}
+        filters = {'PINN': ["physics-informed neural networks", "PINN"]}
+        with mock.patch.object(arxiv_daily, 'fetch_results', return_value=[result]):
+            data = arxiv_daily.get_daily_papers_batched(keywords, filters, max_results=10)
+        self.assertEqual(list(data[0]['PINN']), ['2610.00001'])
+
+
+if __name__ == '__main__':
+    unittest.main()